@@ -0,0 +1,109 @@
+"""
+Shared fixtures for the stub-reader tests
+Builds a real GolfOCR from a temporary config, with the EasyOCR reader and OpenCV
+replaced by stubs so no OCR models are needed
+"""
+
+import json
+import sys
+
+import numpy as np
+import pytest
+
+import main
+
+# Small synthetic layout: label -> [x, y, width, height]
+BOXES = {
+    "DISTANCE_TO_PIN": [30, 10, 40, 20],
+    "CARRY": [10, 50, 60, 25],
+    "FROM_PIN": [25, 90, 30, 15],
+    "STROKES_GAINED": [5, 120, 80, 30],
+}
+
+# Crops containing this value make the stub reader raise
+POISON = 255
+
+
+class StubReader:
+    """Mimics Reader.recognize: one result per box, bbox = the box, boxes sorted by top edge"""
+
+    def __init__(self):
+        self.fetches = 0  # Times main._get_reader handed this reader out
+        self.calls = []
+
+    def recognize(self, image, horizontal_list, free_list, batch_size, detail=1, reformat=True):
+        self.calls.append((image, horizontal_list))
+        results = []
+        for x_min, x_max, y_min, y_max in sorted(horizontal_list, key=lambda box: box[2]):
+            crop = image[y_min:y_max, x_min:x_max]
+            if (crop == POISON).any():
+                raise RuntimeError("poisoned crop")
+            # Each crop is filled with a single value; read it back as the OCR text
+            text = str(int(crop[0, 0]))
+            bbox = [[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]
+            results.append((bbox, text, 0.99))
+        return results
+
+
+class StubCV2:
+    """Stands in for OpenCV: imread serves registered arrays by path, None for anything else"""
+
+    IMREAD_GRAYSCALE = 0
+
+    def __init__(self):
+        self.images = {}
+
+    def imread(self, path, flags=None):
+        return self.images.get(str(path))
+
+
+def make_image(values):
+    """Synthetic screenshot with each box filled with its own value"""
+    image = np.zeros((160, 100), dtype=np.uint8)
+    for (x, y, w, h), value in zip(BOXES.values(), values):
+        image[y:y + h, x:x + w] = value
+    return image
+
+
+def expected_values(j):
+    """Distinct per-box fill values for the j-th synthetic image"""
+    return [10 * (j + 1) + i for i in range(len(BOXES))]
+
+
+def expected_results(j):
+    return {label: str(value) for label, value in zip(BOXES, expected_values(j))}
+
+
+@pytest.fixture
+def stub_reader(monkeypatch):
+    reader = StubReader()
+
+    def get_reader(gpu, quantize):
+        reader.fetches += 1
+        return reader
+
+    monkeypatch.setattr(main, "_get_reader", get_reader)
+    return reader
+
+
+@pytest.fixture
+def stub_cv2(monkeypatch):
+    cv2 = StubCV2()
+    monkeypatch.setitem(sys.modules, "cv2", cv2)
+    return cv2
+
+
+@pytest.fixture
+def make_ocr(tmp_path, stub_reader, stub_cv2):
+    """Factory building a GolfOCR from a temporary config for the synthetic layout"""
+    def make(decimal_metrics=(), **kwargs):
+        config = {
+            "metrics": {
+                label: {"bbox": bbox, "expect_decimal": label in decimal_metrics}
+                for label, bbox in BOXES.items()
+            }
+        }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config))
+        return main.GolfOCR(config_path=str(config_path), gpu=False, **kwargs)
+    return make
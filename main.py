@@ -5,22 +5,74 @@ Simple, reliable OCR extraction using EasyOCR with hardcoded bounding boxes
 """
 
 import argparse
-import cv2
-import easyocr
 import json
-import math
+import multiprocessing
+import numpy as np
 import os
+import queue
 import re
 import csv
-from typing import Dict, List, Optional, Tuple
-import glob
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+import threading
+import time
+
+if TYPE_CHECKING:
+    import easyocr
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library json module
+    orjson = None
+
+# Number with optional sign, captured separately as (sign, digits)
+_NUM_RE = re.compile(r'([+-]?)(\d+\.?\d*)')
+
+# File extensions picked up by process_directory
+_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff'}
+
+# Maximum number of images buffered between pipeline stages
+_PIPELINE_QUEUE_SIZE = 4
+
+# EasyOCR readers shared by every GolfOCR in this process, keyed on (languages, gpu, quantize)
+_READER_CACHE: Dict[Tuple[Tuple[str, ...], bool, bool], "easyocr.Reader"] = {}
+
+# Pipeline batching: recognize up to this many crops at once, waiting at most this many seconds
+_BATCH_MAX_CROPS = 32
+_BATCH_TIMEOUT = 0.1
+
+# Per-process OCR extractor used by process_directory's worker pool
+_WORKER_OCR = None
 
 class GolfOCR:
     """Simple OCR extractor using EasyOCR with configurable bounding boxes"""
     
-    def __init__(self, verbose: bool = False, config_path: str = "config.json"):
+    def __init__(self, verbose: bool = False, config_path: str = "config.json",
+                 gpu: Optional[bool] = None, quantize: bool = True, num_threads: Optional[int] = None):
         self.verbose = verbose
-        self.reader = easyocr.Reader(['en'], gpu=False, verbose=False)
+        self.config_path = config_path
+        self.num_threads = num_threads
+        
+        # Heavy dependencies (OpenCV, PyTorch via EasyOCR) are imported only when OCR is set up,
+        # so CLI paths that never run OCR (e.g. --help) start quickly
+        import cv2
+        self._cv2 = cv2
+        
+        # Limit PyTorch's thread pools before the reader starts using them
+        if num_threads:
+            _set_torch_threads(num_threads)
+        
+        # Use the GPU when one is available unless told otherwise
+        if gpu is None:
+            import torch
+            gpu = torch.cuda.is_available()
+        self.gpu = gpu
+        self.quantize = quantize
+        
+        # The EasyOCR reader is created on first use (see the reader property), so a
+        # process that only hands images to pool workers never loads the models
+        self._reader = None
         
         # Load configuration
         self.config = self._load_config(config_path)
@@ -29,24 +81,46 @@ class GolfOCR:
         metrics = self.config.get("metrics", {})
         self.labels = list(metrics.keys())
         self.boxes = [tuple(metrics[label]["bbox"]) for label in self.labels]
+        # EasyOCR horizontal_list format: [x_min, x_max, y_min, y_max]
+        self.horizontal_list = [[x, x + w, y, y + h] for (x, y, w, h) in self.boxes]
         self.decimal_metrics = {
             label for label, config in metrics.items() 
             if config.get("expect_decimal", False)
         }
+        # Per-box scoring inputs (box centers are in full image coordinates, like OCR results)
+        self.box_centers = [(x + w / 2.0, y + h / 2.0) for (x, y, w, h) in self.boxes]
+        self.expect_decimals = [label in self.decimal_metrics for label in self.labels]
+        # Output column order for the CSV results
+        self.csv_metrics = sorted(self.labels)
         
         if self.verbose:
             print(f"Loaded configuration for {len(self.labels)} metrics")
             for i, label in enumerate(self.labels):
                 print(f"  {label}: bbox={self.boxes[i]}, decimal={label in self.decimal_metrics}")
     
+    @property
+    def reader(self) -> "easyocr.Reader":
+        """Shared EasyOCR reader, fetched (and warmed up) the first time OCR runs"""
+        if self._reader is None:
+            self._reader = _get_reader(self.gpu, self.quantize)
+            
+            # Warm up the recognizer so the first image doesn't pay one-time model setup cost
+            height = max(y + h for (x, y, w, h) in self.boxes)
+            width = max(x + w for (x, y, w, h) in self.boxes)
+            self._reader.recognize(np.zeros((height, width), dtype=np.uint8),
+                                   horizontal_list=self.horizontal_list,
+                                   free_list=[], batch_size=len(self.boxes))
+        
+        return self._reader
+    
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from JSON file with validation"""
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                config = _json_loads(f.read())
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file: {e}")
         
@@ -75,6 +149,10 @@ class GolfOCR:
         """
         Extract the best numeric candidate from OCR results based on proximity to box center
         
+        With detection skipped, recognize() returns a single result per box (the whole
+        box), which is returned as-is; proximity and decimal scoring only run for
+        multi-candidate input such as readtext() output.
+        
         Args:
             ocr_results: List of (bbox, text, confidence) from EasyOCR
             box_center: Expected center of the bounding box
@@ -83,48 +161,47 @@ class GolfOCR:
         Returns:
             Best numeric string found, or empty string if none found
         """
-        candidates = []
+        numbers = []
+        bboxes = []
+        confidences = []
         
         for bbox, text, conf in ocr_results:
             clean_text = text.strip()
             
-            # Skip if no digits found
-            if not re.search(r'\d', clean_text):
-                continue
-            
-            # Extract number with optional sign
-            match = re.search(r'[+-]?\d+\.?\d*', clean_text)
+            # Extract number with optional sign (skips text without digits)
+            match = _NUM_RE.search(clean_text)
             if not match:
                 continue
             
-            num_str = match.group(0)
+            sign, digits = match.groups()
             
             # Handle explicit + sign in original text
-            if '+' in clean_text and not num_str.startswith('+'):
-                num_str = '+' + num_str.lstrip('+-')
-            
-            # Calculate distance from expected center
-            x_coords = [p[0] for p in bbox]
-            y_coords = [p[1] for p in bbox]
-            text_center = (sum(x_coords) / 4, sum(y_coords) / 4)
-            
-            distance = math.hypot(text_center[0] - box_center[0], text_center[1] - box_center[1])
+            if sign != '+' and '+' in clean_text:
+                sign = '+'
+            num_str = sign + digits
             
-            # Apply decimal preference bonus
-            decimal_bonus = -10.0 if expect_decimal and '.' in num_str else 0.0
-            score = distance + decimal_bonus
-            
-            candidates.append((score, num_str, conf))
-            
-            if self.verbose:
-                print(f"    Candidate: '{num_str}' (score: {score:.1f}, conf: {conf:.2f})")
+            numbers.append(num_str)
+            bboxes.append(bbox)
+            confidences.append(conf)
         
-        if not candidates:
+        if not numbers:
             return ""
         
-        # Sort by score (lower is better) and return best candidate
-        candidates.sort(key=lambda x: x[0])
-        return candidates[0][1]
+        if len(numbers) == 1:
+            if self.verbose:
+                print(f"    Candidate: '{numbers[0]}' (conf: {confidences[0]:.2f})")
+            return numbers[0]
+        
+        corners = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4, 2)
+        has_dot = np.array(['.' in num_str for num_str in numbers], dtype=np.bool_)
+        scores = _score_candidates(corners, box_center[0], box_center[1], has_dot, expect_decimal)
+        
+        if self.verbose:
+            for num_str, score, conf in zip(numbers, scores, confidences):
+                print(f"    Candidate: '{num_str}' (score: {score:.1f}, conf: {conf:.2f})")
+        
+        # Lowest score wins
+        return numbers[int(np.argmin(scores))]
     
     def extract_from_image(self, image_path: str) -> Dict[str, str]:
         """
@@ -136,124 +213,375 @@ class GolfOCR:
         Returns:
             Dictionary with metric names as keys and extracted values as strings
         """
-        if self.verbose:
-            print(f"Processing: {image_path}")
-        
-        # Load image
-        image = cv2.imread(image_path)
-        if image is None:
+        return self._extract_batch([self._load_gray(image_path)], [image_path])[0]
+    
+    def _load_gray(self, image_path: str) -> np.ndarray:
+        """Load an image from disk as a grayscale array"""
+        # Load image, decoding straight to grayscale
+        gray = self._cv2.imread(image_path, self._cv2.IMREAD_GRAYSCALE)
+        if gray is None:
             raise ValueError(f"Could not load image: {image_path}")
         
-        results = {}
+        return gray
+    
+    def _extract_batch(self, grays: List[np.ndarray],
+                       image_paths: Optional[List[str]] = None) -> List[Dict[str, str]]:
+        """
+        Extract all metrics from several grayscale screenshots with one recognizer call
         
-        # Extract each metric
-        for i, (x, y, w, h) in enumerate(self.boxes):
-            label = self.labels[i]
-            
-            if self.verbose:
-                print(f"  Extracting {label}...")
-            
-            # Create crop
-            crop = image[y:y+h, x:x+w]
-            gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+        Every metric box of every image is pasted into one tall canvas, so the
+        recognizer gets all crops in one call (batched on GPU; on CPU EasyOCR still
+        recognizes the boxes one at a time). Results are mapped back to
+        their image and metric in original image coordinates. A single image is
+        recognized in place using the precomputed horizontal_list.
+        
+        image_paths, if given, are only used to label verbose output.
+        """
+        if len(grays) == 1:
+            image = grays[0]
+            horizontal_list = self.horizontal_list
+            slots = [(0, i, 0, 0) for i in range(len(self.boxes))]
+        else:
+            image, horizontal_list, slots = self._build_canvas(grays)
+        
+        box_results = [[[] for _ in self.boxes] for _ in grays]
+        
+        if horizontal_list:
+            # Recognize all crops in one call - boxes are known, so detection is skipped
+            ocr_results = self.reader.recognize(image, horizontal_list=horizontal_list, free_list=[],
+                                                batch_size=len(horizontal_list), detail=1, reformat=False)
             
-            # Run OCR
-            ocr_results = self.reader.readtext(gray)
+            # Dispatch each result to the slot containing its center, in image coordinates
+            for bbox, text, conf in ocr_results:
+                index = _slot_index(bbox, horizontal_list)
+                if index is None:
+                    continue
+                j, i, dx, dy = slots[index]
+                bbox = [[px + dx, py + dy] for px, py in bbox]
+                box_results[j][i].append((bbox, text, conf))
+        
+        batch_results = []
+        
+        for j, image_box_results in enumerate(box_results):
+            results = {}
             
-            # Find best numeric candidate
-            box_center = (w / 2, h / 2)
-            expect_decimal = label in self.decimal_metrics
+            if self.verbose and image_paths:
+                print(f"Processing: {image_paths[j]}")
             
-            value = self.extract_best_number(ocr_results, box_center, expect_decimal)
-            results[label] = value
+            # Extract each metric
+            for i, label in enumerate(self.labels):
+                if self.verbose:
+                    print(f"  Extracting {label}...")
+                
+                # Find best numeric candidate
+                value = self.extract_best_number(image_box_results[i], self.box_centers[i],
+                                                 self.expect_decimals[i])
+                results[label] = value
+                
+                if self.verbose:
+                    print(f"    Result: '{value}'")
             
-            if self.verbose:
-                print(f"    Result: '{value}'")
+            batch_results.append(results)
+        
+        return batch_results
+    
+    def _build_canvas(self, grays: List[np.ndarray]) -> Tuple[np.ndarray, List[List[int]], List[Tuple]]:
+        """
+        Paste every metric box of every image into one canvas, top to bottom
         
-        return results
+        Returns:
+            The canvas, its horizontal_list (one box per slot), and for each slot the
+            (image index, box index, x offset, y offset) back to image coordinates
+        """
+        crops = []
+        slots = []
+        canvas_height = canvas_width = 0
+        for j, gray in enumerate(grays):
+            for i, (x, y, w, h) in enumerate(self.boxes):
+                crop = gray[y:y + h, x:x + w]
+                if crop.size == 0:
+                    continue
+                crops.append(crop)
+                slots.append((j, i, x, y - canvas_height))
+                canvas_height += crop.shape[0]
+                canvas_width = max(canvas_width, crop.shape[1])
+        
+        canvas = np.zeros((canvas_height, canvas_width), dtype=np.uint8)
+        horizontal_list = []
+        top = 0
+        for crop in crops:
+            height, width = crop.shape
+            canvas[top:top + height, :width] = crop
+            horizontal_list.append([0, width, top, top + height])
+            top += height
+        
+        return canvas, horizontal_list, slots
     
-    def process_directory(self, input_dir: str, output_dir: str = "output") -> Dict[str, Dict[str, str]]:
+    def process_directory(self, input_dir: str, output_dir: str = "output",
+                          workers: Optional[int] = None) -> Dict[str, int]:
         """
-        Process all images in a directory
+        Process all images in a directory, writing results as they are produced
+        
+        Each image's metrics are appended to golf_ocr_results.csv and
+        golf_ocr_results.jsonl (one {filename: metrics} object per line) in the
+        output directory, so memory use doesn't grow with the number of images.
         
         Args:
             input_dir: Directory containing golf screenshots
             output_dir: Directory to save results
+            workers: Number of worker processes on CPU (defaults to CPU count, 1 = in-process);
+                GPU runs always process images in-process
             
         Returns:
-            Dictionary mapping filenames to their extracted metrics
+            Dictionary with the 'total' and 'successful' image counts
         """
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Find all image files
-        image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.bmp', '*.tiff']
+        # Find all image files in a single directory scan
         image_files = []
-        for ext in image_extensions:
-            image_files.extend(glob.glob(os.path.join(input_dir, ext)))
+        if os.path.isdir(input_dir):
+            with os.scandir(input_dir) as entries:
+                # Skip hidden files (like glob did), e.g. macOS ._IMG_0001.png AppleDouble files
+                image_files = sorted(
+                    entry.path for entry in entries
+                    if entry.is_file() and not entry.name.startswith('.')
+                    and os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS
+                )
         
         if not image_files:
             print(f"No images found in {input_dir}")
-            return {}
+            return {"total": 0, "successful": 0}
         
         print(f"Found {len(image_files)} images to process")
         
-        all_results = {}
+        csv_path = os.path.join(output_dir, "golf_ocr_results.csv")
+        jsonl_path = os.path.join(output_dir, "golf_ocr_results.jsonl")
+        
+        successful = 0
         
-        # Process each image
-        for image_path in sorted(image_files):
-            filename = os.path.basename(image_path)
+        with open(csv_path, 'w', newline='') as csv_file, open(jsonl_path, 'wb') as jsonl_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['filename'] + self.csv_metrics)  # Failed images get empty metric columns
             
-            try:
-                results = self.extract_from_image(image_path)
-                all_results[filename] = results
+            # Process each image
+            for image_path, results in zip(image_files, self._iter_results(image_files, workers)):
+                filename = os.path.basename(image_path)
                 
+                # Write results immediately so partial runs still leave usable output
+                writer.writerow([filename] + [results.get(metric, '') for metric in self.csv_metrics])
+                jsonl_file.write(_json_dumps({filename: results}) + b'\n')
+                csv_file.flush()
+                jsonl_file.flush()
+                
+                if "error" in results:
+                    print(f"❌ {filename}: {results['error']}")
+                    continue
+                
+                successful += 1
                 if self.verbose:
                     print(f"✅ {filename}: {results}")
                 else:
                     print(f"✅ {filename}")
-                    
-            except Exception as e:
-                print(f"❌ {filename}: {e}")
-                all_results[filename] = {"error": str(e)}
         
-        # Save results
-        self.save_results(all_results, output_dir)
+        print(f"Results saved to {csv_path}")
+        print(f"Results saved to {jsonl_path}")
         
-        return all_results
+        return {"total": len(image_files), "successful": successful}
     
-    def save_results(self, results: Dict[str, Dict[str, str]], output_dir: str):
-        """Save results to JSON and CSV files"""
-        
-        # Save JSON
-        json_path = os.path.join(output_dir, "golf_ocr_results.json")
-        with open(json_path, 'w') as f:
-            json.dump(results, f, indent=2)
-        print(f"Results saved to {json_path}")
-        
-        # Save CSV
-        csv_path = os.path.join(output_dir, "golf_ocr_results.csv")
-        
-        # Get all metric names for CSV headers
-        all_metrics = set()
-        for file_results in results.values():
-            all_metrics.update(file_results.keys())
-        
-        # Remove 'error' from metrics if present
-        all_metrics.discard('error')
-        headers = ['filename'] + sorted(all_metrics)
+    def _iter_results(self, image_files: List[str], workers: Optional[int]) -> Iterator[Dict[str, str]]:
+        """Yield extraction results for each image, in order"""
+        # On the GPU a single process batches crops across images; a pool would put one
+        # model per CPU core on the same device, so worker processes are CPU-only
+        if self.gpu:
+            workers = 1
+        
+        workers = min(workers or os.cpu_count() or 1, len(image_files))
+        
+        if workers <= 1:
+            yield from self._iter_pipelined(image_files)
+            return
+        
+        # Split the cores between workers so their PyTorch thread pools don't oversubscribe the CPU
+        num_threads = self.num_threads or max(1, (os.cpu_count() or 1) // workers)
+        
+        # Workers are spawned rather than forked, so none of them inherits this process's
+        # PyTorch state - each builds its own EasyOCR reader once, then reuses it. This
+        # process never builds one unless the pool fails.
+        initargs = (self.config_path, self.verbose, self.gpu, self.quantize, num_threads)
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_worker_init, initargs=initargs) as executor:
+                for results in executor.map(_worker_job, image_files, chunksize=4):
+                    yield results
+                    done += 1
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for running out of memory) - finish the rest in-process
+            print(f"⚠️  Worker pool failed ({e}); processing remaining "
+                  f"{len(image_files) - done} images in-process")
+            yield from self._iter_pipelined(image_files[done:])
+    
+    def _iter_pipelined(self, image_files: List[str]) -> Iterator[Dict[str, str]]:
+        """
+        Yield extraction results for each image, in order, overlapping stages
         
-        with open(csv_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            
-            for filename, file_results in results.items():
-                row = [filename]
-                for metric in headers[1:]:  # Skip filename
-                    row.append(file_results.get(metric, ''))
-                writer.writerow(row)
+        A loader thread decodes images while an OCR thread recognizes the previous
+        ones, so disk I/O and decoding are hidden behind OCR time. The OCR thread
+        batches whatever images are ready (up to _BATCH_MAX_CROPS crops, waiting at
+        most _BATCH_TIMEOUT seconds for more) into one recognizer call. Bounded
+        queues keep at most a few batches of decoded images in memory.
+        """
+        batch_images = max(1, _BATCH_MAX_CROPS // len(self.boxes))
+        loaded = queue.Queue(maxsize=max(_PIPELINE_QUEUE_SIZE, batch_images))
+        recognized = queue.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+        
+        def load():
+            for image_path in image_files:
+                try:
+                    loaded.put((image_path, self._load_gray(image_path)))
+                except Exception as e:
+                    loaded.put((image_path, e))
+            loaded.put(None)
+        
+        def next_batch() -> Tuple[List, bool]:
+            """Collect loaded items until the batch is full, the timeout passes, or input ends"""
+            batch = []
+            item = loaded.get()
+            deadline = time.monotonic() + _BATCH_TIMEOUT
+            while item is not None:
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= batch_images or remaining <= 0:
+                    return batch, False
+                try:
+                    item = loaded.get(timeout=remaining)
+                except queue.Empty:
+                    return batch, False
+            return batch, True
+        
+        def extract_one(image_path: str, gray: np.ndarray) -> Dict[str, str]:
+            try:
+                return self._extract_batch([gray], [image_path])[0]
+            except Exception as e:
+                return {"error": str(e)}
+        
+        def recognize():
+            finished = False
+            while not finished:
+                batch, finished = next_batch()
+                # Extraction (and its verbose output) happens here, not in the loader thread
+                loaded_ok = [(path, item) for path, item in batch if not isinstance(item, Exception)]
+                try:
+                    extracted = iter(self._extract_batch([gray for _, gray in loaded_ok],
+                                                         [path for path, _ in loaded_ok]))
+                except Exception:
+                    # Retry one image at a time so a single bad image doesn't fail the whole batch
+                    extracted = iter([extract_one(path, gray) for path, gray in loaded_ok])
+                for _, item in batch:
+                    recognized.put({"error": str(item)} if isinstance(item, Exception) else next(extracted))
+        
+        for target in (load, recognize):
+            threading.Thread(target=target, daemon=True).start()
+        
+        for _ in image_files:
+            yield recognized.get()
+    
+    def _safe_extract(self, image_path: str) -> Dict[str, str]:
+        """Extract metrics from an image, reporting failures as an 'error' entry"""
+        try:
+            return self.extract_from_image(image_path)
+        except Exception as e:
+            return {"error": str(e)}
+
+
+def _slot_index(bbox: List, horizontal_list: List[List[int]]) -> Optional[int]:
+    """Return the index of the horizontal_list box containing the center of an OCR bbox"""
+    center_x = sum(p[0] for p in bbox) / 4
+    center_y = sum(p[1] for p in bbox) / 4
+    
+    for index, (x_min, x_max, y_min, y_max) in enumerate(horizontal_list):
+        if x_min <= center_x <= x_max and y_min <= center_y <= y_max:
+            return index
+    
+    return None
+
+
+def _score_candidates(corners: np.ndarray, center_x: float, center_y: float,
+                      has_dot: np.ndarray, expect_decimal: bool) -> np.ndarray:
+    """
+    Score OCR candidates by distance from the expected center (lower is better)
+    
+    Args:
+        corners: (N, 4, 2) array of candidate bbox corners
+        center_x, center_y: Expected center of the bounding box
+        has_dot: (N,) bool array, True where the candidate contains a decimal point
+        expect_decimal: Whether to apply the decimal preference bonus
+    """
+    centers = corners.mean(axis=1)
+    scores = np.hypot(centers[:, 0] - center_x, centers[:, 1] - center_y)
+    
+    # Apply decimal preference bonus
+    if expect_decimal:
+        scores -= 10.0 * has_dot
+    
+    return scores
+
+
+def _json_loads(data: bytes):
+    """Parse JSON, using orjson when installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to single-line JSON bytes, using orjson when installed"""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+def _get_reader(gpu: bool, quantize: bool) -> "easyocr.Reader":
+    """Return the shared EasyOCR reader for these settings, creating it on first use"""
+    key = (('en',), gpu, quantize)
+    
+    if key not in _READER_CACHE:
+        import easyocr
         
-        print(f"Results saved to {csv_path}")
+        # Boxes are fixed, so only the recognizer is needed - skip loading the text detector.
+        # quantize applies int8 dynamic quantization to the recognizer on CPU.
+        _READER_CACHE[key] = easyocr.Reader(list(key[0]), gpu=gpu, quantize=quantize,
+                                            detector=False, verbose=False)
+    
+    return _READER_CACHE[key]
+
+
+def _set_torch_threads(num_threads: int):
+    """Limit the process-wide PyTorch thread pools"""
+    import torch
+    
+    torch.set_num_threads(num_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set once, before any inter-op parallel work has started
+        pass
+
+
+def _worker_init(config_path: str, verbose: bool, gpu: bool, quantize: bool, num_threads: int):
+    """Create the OCR extractor (and its EasyOCR reader) once per worker process"""
+    global _WORKER_OCR
+    
+    # Workers are spawned, so PyTorch isn't loaded yet and the OpenMP/MKL runtimes
+    # will still read these when they start
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(num_threads)
+    
+    _WORKER_OCR = GolfOCR(verbose=verbose, config_path=config_path, gpu=gpu, quantize=quantize,
+                          num_threads=num_threads)
+    _WORKER_OCR.reader  # Load the models up front rather than on the first image
+
+
+def _worker_job(image_path: str) -> Dict[str, str]:
+    """Extract metrics from one image using this worker's OCR extractor"""
+    return _WORKER_OCR._safe_extract(image_path)
 
 
 def main():
@@ -261,12 +589,20 @@ def main():
     parser.add_argument("--input-dir", default="photos", help="Input directory containing images")
     parser.add_argument("--output-dir", default="output", help="Output directory for results")
     parser.add_argument("--single-image", help="Process single image instead of directory")
+    parser.add_argument("--workers", type=int, help="Number of CPU worker processes (default: CPU count; ignored on GPU)")
+    parser.add_argument("--device", choices=["auto", "gpu", "cpu"], default="auto",
+                        help="Run OCR on the GPU or CPU (default: GPU if available)")
+    parser.add_argument("--no-quantize", dest="quantize", action="store_false",
+                        help="Disable int8 quantization of the recognizer on CPU")
+    parser.add_argument("--threads", type=int,
+                        help="PyTorch threads per process (default: CPU count split across workers)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     
     args = parser.parse_args()
     
     # Create OCR extractor
-    ocr = GolfOCR(verbose=args.verbose)
+    gpu = {"auto": None, "gpu": True, "cpu": False}[args.device]
+    ocr = GolfOCR(verbose=args.verbose, gpu=gpu, quantize=args.quantize, num_threads=args.threads)
     
     if args.single_image:
         # Process single image
@@ -279,16 +615,17 @@ def main():
             print(f"Error processing {args.single_image}: {e}")
     else:
         # Process directory
-        results = ocr.process_directory(args.input_dir, args.output_dir)
+        summary = ocr.process_directory(args.input_dir, args.output_dir, args.workers)
         
         # Print summary
-        successful = sum(1 for r in results.values() if 'error' not in r)
-        total = len(results)
+        successful = summary["successful"]
+        total = summary["total"]
         print(f"\n=== Summary ===")
         print(f"Total images: {total}")
         print(f"Successful: {successful}")
         print(f"Failed: {total - successful}")
-        print(f"Success rate: {successful/total*100:.1f}%")
+        if total:
+            print(f"Success rate: {successful/total*100:.1f}%")
 
 
 if __name__ == "__main__":
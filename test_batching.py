@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Batching tests for Golf Photo OCR
+Checks that crops batched across images map back to the right image and metric,
+using a stub in place of the EasyOCR reader (no models needed)
+"""
+
+from conftest import BOXES, POISON, expected_results, expected_values, make_image
+
+
+def record_scoring(ocr):
+    """Wrap extract_best_number to record what each metric gets scored against"""
+    scored = []
+    extract_best_number = ocr.extract_best_number
+    def recording_extract(ocr_results, box_center, expect_decimal=False):
+        scored.append((ocr_results, box_center, expect_decimal))
+        return extract_best_number(ocr_results, box_center, expect_decimal)
+    ocr.extract_best_number = recording_extract
+    return scored
+
+
+def test_batch_maps_results_to_image_and_metric(make_ocr, stub_reader):
+    """Results from a multi-image canvas land on the right image, metric and coordinates"""
+    ocr = make_ocr(decimal_metrics={"CARRY", "STROKES_GAINED"})
+    scored = record_scoring(ocr)
+    ocr.reader  # Warm up first so only the batch call is counted
+    stub_reader.calls.clear()
+
+    grays = [make_image(expected_values(j)) for j in range(3)]
+    batch_results = ocr._extract_batch(grays)
+
+    assert len(stub_reader.calls) == 1
+    assert batch_results == [expected_results(j) for j in range(3)]
+
+    # Bboxes are shifted back from canvas to original image coordinates, and each
+    # metric is scored with the center and decimal flag from config
+    for n, (ocr_results, box_center, expect_decimal) in enumerate(scored):
+        label, (x, y, w, h) = list(BOXES.items())[n % len(BOXES)]
+        assert len(ocr_results) == 1
+        assert ocr_results[0][0] == [[x, y], [x + w, y], [x + w, y + h], [x, y + h]]
+        assert box_center == (x + w / 2.0, y + h / 2.0)
+        assert expect_decimal == (label in {"CARRY", "STROKES_GAINED"})
+
+
+def test_single_image_is_recognized_in_place(make_ocr, stub_reader):
+    """A batch of one skips the canvas and uses the precomputed horizontal_list"""
+    ocr = make_ocr()
+    ocr.reader  # Warm up first so only the batch call is counted
+    stub_reader.calls.clear()
+
+    gray = make_image(expected_values(0))
+    assert ocr._extract_batch([gray]) == [expected_results(0)]
+
+    [(image, horizontal_list)] = stub_reader.calls
+    assert image is gray
+    assert horizontal_list is ocr.horizontal_list
+    assert horizontal_list == [[x, x + w, y, y + h] for (x, y, w, h) in BOXES.values()]
+
+
+def test_batch_handles_clipped_boxes(make_ocr):
+    """A box running off the edge of a smaller image only affects that image"""
+    ocr = make_ocr()
+
+    small = make_image(expected_values(1))[:135]  # Cuts STROKES_GAINED to 15 rows
+    batch_results = ocr._extract_batch([make_image(expected_values(0)), small])
+
+    assert batch_results == [expected_results(0), expected_results(1)]
+
+
+def test_pipeline_isolates_failed_image_in_batch(make_ocr, stub_cv2):
+    """One image that fails recognition doesn't fail the rest of its batch"""
+    ocr = make_ocr()
+
+    stub_cv2.images.update({
+        "a.png": make_image(expected_values(0)),
+        "b.png": make_image([POISON] * len(BOXES)),
+        "c.png": make_image(expected_values(2)),
+    })
+
+    results = list(ocr._iter_pipelined(["a.png", "b.png", "c.png"]))
+
+    assert results == [expected_results(0), {"error": "poisoned crop"}, expected_results(2)]
+
+
+def test_verbose_output_is_attributed_to_the_right_image(make_ocr, stub_cv2, capsys):
+    """Each image's verbose header comes right before its own metric results"""
+    ocr = make_ocr(verbose=True)
+    ocr.reader  # Warm up outside the captured output
+
+    image_files = ["a.png", "b.png", "c.png"]
+    for j, image_path in enumerate(image_files):
+        stub_cv2.images[image_path] = make_image(expected_values(j))
+    capsys.readouterr()
+
+    list(ocr._iter_pipelined(image_files))
+
+    lines = [line.strip() for line in capsys.readouterr().out.splitlines()
+             if line.startswith("Processing:") or "Result:" in line]
+    expected = []
+    for j, image_path in enumerate(image_files):
+        expected.append(f"Processing: {image_path}")
+        expected.extend(f"Result: '{value}'" for value in expected_values(j))
+    assert lines == expected
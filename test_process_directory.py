@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Directory processing tests for Golf Photo OCR
+Covers result output and the worker pool path using stubs in place of the EasyOCR reader and the
+process pool (no models or worker processes needed)
+"""
+
+import csv
+import json
+from concurrent.futures.process import BrokenProcessPool
+
+import main
+from conftest import BOXES, expected_results, expected_values, make_image
+
+POOL_RESULT = {"CARRY": "from pool"}
+
+
+class StubPool:
+    """Stands in for ProcessPoolExecutor, optionally dying after a number of results"""
+
+    def __init__(self, die_after=None, **kwargs):
+        self.die_after = die_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, iterable, chunksize=1):
+        for n, _ in enumerate(iterable):
+            if n == self.die_after:
+                raise BrokenProcessPool("A worker process terminated abruptly")
+            yield dict(POOL_RESULT)
+
+
+def test_reader_is_created_lazily(make_ocr, stub_reader):
+    """Constructing GolfOCR doesn't load the OCR models"""
+    make_ocr()
+
+    assert stub_reader.fetches == 0
+    assert stub_reader.calls == []
+
+
+def test_pool_path_never_builds_reader_in_parent(make_ocr, stub_reader, monkeypatch):
+    """Images handed to pool workers don't make the parent load its own reader"""
+    monkeypatch.setattr(main, "ProcessPoolExecutor", StubPool)
+    ocr = make_ocr()
+
+    results = list(ocr._iter_results(["a.png", "b.png", "c.png"], workers=2))
+
+    assert results == [POOL_RESULT] * 3
+    assert stub_reader.fetches == 0
+
+
+def test_broken_pool_falls_back_to_in_process(make_ocr, stub_cv2, monkeypatch, capsys):
+    """A dead worker doesn't end the run - the remaining images are processed in-process"""
+    monkeypatch.setattr(main, "ProcessPoolExecutor", lambda **kwargs: StubPool(die_after=2))
+    ocr = make_ocr()
+
+    image_files = [f"{name}.png" for name in "abcd"]
+    for j, image_path in enumerate(image_files):
+        stub_cv2.images[image_path] = make_image(expected_values(j))
+
+    results = list(ocr._iter_results(image_files, workers=2))
+
+    assert results == [POOL_RESULT, POOL_RESULT, expected_results(2), expected_results(3)]
+    assert "processing remaining 2 images in-process" in capsys.readouterr().out
+
+
+def test_process_directory_streams_csv_and_jsonl(make_ocr, stub_cv2, tmp_path):
+    """Every image gets a CSV row and a JSONL line, including images that fail"""
+    ocr = make_ocr()
+
+    input_dir = tmp_path / "photos"
+    input_dir.mkdir()
+    for j, name in enumerate(["a.png", "b.png"]):
+        (input_dir / name).write_bytes(b"")
+        stub_cv2.images[str(input_dir / name)] = make_image(expected_values(j))
+    (input_dir / "broken.png").write_bytes(b"")  # Unreadable: stub imread returns None
+
+    output_dir = tmp_path / "output"
+    summary = ocr.process_directory(str(input_dir), str(output_dir), workers=1)
+
+    assert summary == {"total": 3, "successful": 2}
+
+    # Columns come from config (sorted); failed images get empty metric columns
+    metrics = sorted(BOXES)
+    with open(output_dir / "golf_ocr_results.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        ["filename"] + metrics,
+        ["a.png"] + [expected_results(0)[metric] for metric in metrics],
+        ["b.png"] + [expected_results(1)[metric] for metric in metrics],
+        ["broken.png"] + [""] * len(metrics),
+    ]
+
+    # One {filename: metrics} object per line, errors included
+    lines = (output_dir / "golf_ocr_results.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"a.png": expected_results(0)},
+        {"b.png": expected_results(1)},
+        {"broken.png": {"error": f"Could not load image: {input_dir / 'broken.png'}"}},
+    ]
+
+
+def test_process_directory_without_images(make_ocr, tmp_path):
+    """An empty or missing input directory reports no images and writes nothing"""
+    ocr = make_ocr()
+    output_dir = tmp_path / "output"
+
+    assert ocr.process_directory(str(tmp_path / "missing"), str(output_dir)) == {"total": 0, "successful": 0}
+    assert list(output_dir.iterdir()) == []
+
+
+def test_process_directory_image_discovery(make_ocr, stub_cv2, tmp_path):
+    """Extensions match case-insensitively; hidden files, other files and subdirectories are skipped"""
+    ocr = make_ocr()
+
+    input_dir = tmp_path / "photos"
+    input_dir.mkdir()
+    (input_dir / "nested.png").mkdir()
+    for name in ["a.PNG", "b.Jpeg", "c.TIFF", ".hidden.png", "._c.TIFF", "notes.txt"]:
+        (input_dir / name).write_bytes(b"")
+        stub_cv2.images[str(input_dir / name)] = make_image(expected_values(0))
+
+    output_dir = tmp_path / "output"
+    summary = ocr.process_directory(str(input_dir), str(output_dir), workers=1)
+
+    assert summary == {"total": 3, "successful": 3}
+    lines = (output_dir / "golf_ocr_results.jsonl").read_text().splitlines()
+    assert sorted(name for line in lines for name in json.loads(line)) == ["a.PNG", "b.Jpeg", "c.TIFF"]